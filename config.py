@@ -1,21 +1,55 @@
 import os
 
-basedir = os.path.abspath(os.path.dirname(__file__))
+
+def _default_sqlite_uri():
+    """
+    Build the sqlite fallback for when DATABASE_URL isn't set, deferring
+    the path syscalls until the default is actually needed.
+    """
+    basedir = os.path.abspath(os.path.dirname(__file__))
+    return "sqlite:///" + os.path.join(basedir, "app.db")
+
+
+class LazyEnv:
+    """
+    Descriptor for a config setting backed by an environment variable.
+
+    The variable is read on first attribute access and memoized, so
+    importing this module doesn't touch the environment for settings
+    that are never used. The default may be a callable, in which case it
+    is only invoked if the variable is unset.
+    """
+
+    _UNSET = object()
+
+    def __init__(self, key, default=""):
+        self.key = key
+        self.default = default
+        self.value = self._UNSET
+
+    def __get__(self, obj, cls):
+        if self.value is self._UNSET:
+            value = os.environ.get(self.key)
+            if not value:
+                value = self.default() if callable(self.default) else self.default
+            self.value = value
+        return self.value
 
 
 class Config(object):
     DEBUG = False
-    SLACK_EVENTS_URL = os.environ.get("SLACK_EVENTS_URL") or ""
+    SLACK_EVENTS_URL = LazyEnv("SLACK_EVENTS_URL")
     TESTING = False
-    SECRET_KEY = os.environ.get("SECRET_KEY") or ""
-    SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET") or ""
-    SLACK_APP_TOKEN = os.environ.get("SLACK_APP_TOKEN") or ""
-    SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN") or ""
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///" + os.path.join(
-        basedir, "app.db"
-    )
+    SECRET_KEY = LazyEnv("SECRET_KEY")
+    SLACK_SIGNING_SECRET = LazyEnv("SLACK_SIGNING_SECRET")
+    SLACK_APP_TOKEN = LazyEnv("SLACK_APP_TOKEN")
+    SLACK_BOT_TOKEN = LazyEnv("SLACK_BOT_TOKEN")
+    SQLALCHEMY_DATABASE_URI = LazyEnv("DATABASE_URL", _default_sqlite_uri)
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     SOCKET_MODE = True
+    # When True, listing queries raise on unexpected lazy relationship
+    # loads instead of quietly issuing N+1 queries.
+    STRICT_LOADING = False
 
 
 class DevelopmentConfig(Config):
@@ -24,8 +58,9 @@ class DevelopmentConfig(Config):
 
 class TestConfig(Config):
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = os.environ.get("DATABASE_URL") or "sqlite:///:memory:"
-    SLACK_SIGNING_SECRET = os.environ.get("SLACK_SIGNING_SECRET") or "x"
-    SLACK_BOT_TOKEN = os.environ.get("SLACK_BOT_TOKEN") or "x"
-    SLACK_EVENTS_URL = os.environ.get("SLACK_EVENTS_URL") or "/x/"
+    SQLALCHEMY_DATABASE_URI = LazyEnv("DATABASE_URL", "sqlite:///:memory:")
+    SLACK_SIGNING_SECRET = LazyEnv("SLACK_SIGNING_SECRET", "x")
+    SLACK_BOT_TOKEN = LazyEnv("SLACK_BOT_TOKEN", "x")
+    SLACK_EVENTS_URL = LazyEnv("SLACK_EVENTS_URL", "/x/")
     SOCKET_MODE = False  # TODO: Mock out the FlaskSocketModeClient
+    STRICT_LOADING = True
@@ -0,0 +1,30 @@
+"""Add index backing the duplicate quote check
+
+Revision ID: 3f2d8c1e5a40
+Revises: 649afdda18eb
+Create Date: 2026-08-28 10:14:52.118734
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "3f2d8c1e5a40"
+down_revision = "649afdda18eb"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table("quote", schema=None) as batch_op:
+        batch_op.create_index(
+            "ix_quote_person_id_lower_content",
+            ["person_id", sa.text("lower(content)")],
+            unique=False,
+        )
+
+
+def downgrade():
+    with op.batch_alter_table("quote", schema=None) as batch_op:
+        batch_op.drop_index("ix_quote_person_id_lower_content")
@@ -9,19 +9,44 @@ from config import DevelopmentConfig
 db = SQLAlchemy()
 migrate = Migrate()
 
-# This import needs to come after db since the import chain
-# in SlackBot eventually imports Person, which needs an
-# instantiated db.
-# TODO: Find a better way to handle circular imports?
-from nb2.bot.slack_bot import SlackBot  # noqa
 
-bot = SlackBot()
+# The shared SlackBot instance, created on first use. Kept under a private
+# name because importing the nb2.bot subpackage makes the import machinery
+# bind "bot" on this module to the subpackage itself.
+_bot = None
+
+
+def _get_bot():
+    """
+    Create the shared SlackBot instance on first use.
+
+    Deferring the import keeps the slack_sdk stack out of entrypoints that
+    only need db (migrations, flask shell), and it must happen after db is
+    instantiated anyway since SlackBot's import chain eventually imports
+    the Person model.
+    """
+    global _bot, bot
+    if _bot is None:
+        from nb2.bot.slack_bot import SlackBot
+
+        _bot = bot = SlackBot()
+    return _bot
+
+
+def __getattr__(name):
+    # PEP 562: `from nb2 import bot` builds the singleton lazily. Once the
+    # nb2.bot subpackage has been imported the name resolves normally, so
+    # _get_bot also rebinds "bot" to the instance to shadow the subpackage.
+    if name == "bot":
+        return _get_bot()
+    raise AttributeError(name)
 
 
 def create_app(config=DevelopmentConfig):
     """Create and configure an instance of Nostalgiabot2"""
 
     app = Flask(__name__, instance_relative_config=True)
+    bot = _get_bot()
 
     # TODO:
     # Find a way to set these more dynamically
@@ -46,12 +71,12 @@ def create_app(config=DevelopmentConfig):
         app.register_blueprint(socket_mode.bp)
 
         app.register_blueprint(commands.bp)
-        bot.init_app(app.config.get("SLACK_BOT_TOKEN"))
 
-        if app.config.get("SOCKET_MODE"):
-            socket_mode.FlaskSocketModeClient(
-                app, app.config.get("SLACK_APP_TOKEN"), bot.web_client
-            )
+        cfg = app.config
+        bot.init_app(cfg.get("SLACK_BOT_TOKEN"))
+
+        if cfg.get("SOCKET_MODE"):
+            socket_mode.FlaskSocketModeClient(app, cfg.get("SLACK_APP_TOKEN"), bot.web_client)
 
         from nb2.models import Person, Quote
 
@@ -1,7 +1,15 @@
-from flask import Blueprint
-from flask_restful import Api, Resource, abort, fields, marshal, reqparse
+import json
+from functools import lru_cache
+
+from flask import Blueprint, Response, g, make_response, request, stream_with_context
+from flask_restful import Api, Resource, abort, fields, reqparse
 from sqlalchemy.exc import IntegrityError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from nb2.service.dtos import AddQuoteDTO, CreateGhostPersonDTO, CreatePersonDTO
 from nb2.service.exceptions import QuoteAlreadyExistsException
 from nb2.service.person_service import (
@@ -15,9 +23,10 @@ from nb2.service.person_service import (
 from nb2.service.quote_service import (
     add_quote_to_person,
     delete_quote,
-    get_all_quotes_from_person,
+    get_person_and_has_said,
+    get_person_and_quote,
     get_quote,
-    get_quote_from_person,
+    iter_quotes_from_person,
     update_quote,
 )
 
@@ -25,22 +34,140 @@ bp = Blueprint("api", __name__)
 api = Api(bp)
 
 
+@api.representation("application/json")
+def output_json(data, code, headers=None):
+    """
+    Serialize responses, with orjson when it is installed.
+
+    orjson dumps straight to bytes several times faster than the stdlib
+    encoder flask_restful uses by default; the payloads are identical
+    minus insignificant whitespace.
+
+    Successful GET responses also carry an ETag derived from the payload
+    so clients sending If-None-Match get a bodiless 304 back.
+    """
+    if orjson is not None:
+        body = orjson.dumps(data)
+    else:
+        body = json.dumps(data, separators=(",", ":"))
+
+    response = make_response(body, code)
+    response.headers.extend(headers or {})
+
+    if code == 200 and request.method == "GET":
+        response.add_etag()
+        return response.make_conditional(request)
+
+    return response
+
+
+@lru_cache(maxsize=128)
+def _make_marshaller(field_items):
+    """
+    Build a function that serializes one object to a plain dict.
+
+    `marshal` re-instantiates field classes and walks its dispatch logic
+    for every object it serializes, which adds up on list endpoints. The
+    fields used here are flat, so the marshaller resolves each field to
+    an instance once and is memoized on the field items, making repeat
+    serialization a single dict comprehension.
+    """
+    resolved = [
+        (key, field() if isinstance(field, type) else field) for key, field in field_items
+    ]
+
+    def marshal_one(obj):
+        return {key: field.output(key, obj) for key, field in resolved}
+
+    return marshal_one
+
+
+def fast_marshal(data, field_dict):
+    """
+    Serialize an object, or a list of objects, using a cached marshaller.
+
+    Drop-in for `marshal(data, field_dict)` for the flat field dicts used
+    by these resources.
+    """
+    marshal_one = _make_marshaller(tuple(field_dict.items()))
+
+    if isinstance(data, list):
+        return [marshal_one(obj) for obj in data]
+
+    return marshal_one(data)
+
+
+def _build_parser(*argspecs):
+    """
+    Build a RequestParser from declarative argument specs.
+
+    Each spec is a dict of add_argument keywords. Resources call this
+    once in their class body, so no argument objects are constructed at
+    request time.
+    """
+    parser = reqparse.RequestParser(bundle_errors=True)
+
+    for spec in argspecs:
+        parser.add_argument(**spec)
+
+    return parser
+
+
+# Generous ceiling for write bodies; real payloads are a few hundred bytes.
+MAX_BODY_BYTES = 64 * 1024
+
+QUOTE_ALREADY_EXISTS = (
+    "The Quote content provided can't be added because it already exists for this Person."
+)
+
+
+def reject_malformed_body():
+    """
+    Cheaply reject write requests before the body parser runs.
+
+    Non-JSON and oversized bodies fail here on header checks alone, so
+    reqparse never reads or decodes them.
+    """
+    if not request.is_json:
+        abort(415, message="Request must be application/json")
+
+    if (request.content_length or 0) > MAX_BODY_BYTES:
+        abort(413, message="Request body too large")
+
+
+def get_person_cached(user_id):
+    """
+    Request-scoped wrapper around get_person.
+
+    The person lookup can probe up to three unique columns, so handlers
+    that resolve the same user_id more than once within a request share
+    the result via flask.g instead of repeating the queries.
+    """
+    cache = getattr(g, "_person_cache", None)
+
+    if cache is None:
+        cache = g._person_cache = {}
+
+    if user_id not in cache:
+        cache[user_id] = get_person(user_id)
+
+    return cache[user_id]
+
+
 class IncludeFilterMixin:
     """
     A mixin for optionally including fields in an API response
 
     To optionally include an API field, the relevant Resource class
-    should inherit from this mixin. The Resource class should then
-    implement a `get_<fieldname>_field_type` property method that
-    returns the type definition of the field to include.
+    should inherit from this mixin and list the field in its
+    `INCLUDABLE_FIELDS` dict, mapping the field name to its type
+    definition.
 
     Example:
-        To optionally include a string field named `foo` implement to following
-        on the appropriate Resource class
+        To optionally include a string field named `foo` declare the
+        following on the appropriate Resource class
 
-        @property
-        def get_foo_field_type(self):
-            return fields.String
+        INCLUDABLE_FIELDS = {"foo": fields.String}
 
         See flask-restful docs for defining field types
         https://flask-restful.readthedocs.io/en/latest/fields.html#basic-usage
@@ -49,62 +176,77 @@ class IncludeFilterMixin:
     `include=fieldname`. Multiple fieldnames are allowed as well:
     `include=fieldname,fieldname,fieldname`.
 
-    Note that this mixin will modify or create `self.field` and `self.parser`
-    properties on the class.
+    Note that this mixin binds `self.fields` to a dict shared across
+    requests (the class's BASE_FIELDS or a cached composition of it);
+    handlers must treat it as read-only.
     """
 
-    def __init__(self, *args, **kwargs):
-        if not hasattr(self, "fields"):
-            self.fields = {}
+    BASE_FIELDS = {}
+    INCLUDABLE_FIELDS = {}
 
-        if not hasattr(self, "parser"):
-            self.parser = reqparse.RequestParser(bundle_errors=True)
-
-        self.parser.add_argument("include", type=str, location="args")
+    # Composed field dicts, keyed by (class, matched include names).
+    # Bounded by the combinations of INCLUDABLE_FIELDS.
+    _composed_fields = {}
 
+    def __init__(self, *args, **kwargs):
+        self.fields = self.BASE_FIELDS
         self.include_fields()
         super(IncludeFilterMixin, self).__init__(*args, **kwargs)
 
     def include_fields(self):
-        parsed_args = self.parser.parse_args()
-        include_fields = parsed_args["include"] or []
+        # A full RequestParser pass is overkill for one optional query
+        # string value; read it straight off the request.
+        include_fields = request.args.get("include")
+
+        if not include_fields:
+            return
+
+        matched = tuple(
+            sorted(f for f in set(include_fields.split(",")) if f in self.INCLUDABLE_FIELDS)
+        )
 
-        if include_fields:
-            include_fields = include_fields.split(",")
+        if not matched:
+            return
 
-        for field in include_fields:
-            field_type = getattr(self, f"get_{field}_field_type", None)
+        key = (type(self), matched)
+        composed = self._composed_fields.get(key)
 
-            if field_type:
-                self.fields[field] = field_type
+        if composed is None:
+            composed = dict(self.BASE_FIELDS)
+            for field in matched:
+                composed[field] = self.INCLUDABLE_FIELDS[field]
+            self._composed_fields[key] = composed
+
+        self.fields = composed
 
 
 class PersonResourceBase(Resource, IncludeFilterMixin):
     """
     A base class for the Person resource to define common properties and methods.
 
-    This class defines a `get_quotes_field_type` method that will allow
-    all Resources that inherit from it to optionally include a `quotes` field
-    in the response.
-    """
+    This class registers the `quotes` field in `INCLUDABLE_FIELDS` so that
+    all Resources that inherit from it can optionally include a `quotes`
+    field in the response.
 
-    def __init__(self, *args, **kwargs):
-        self.fields = {
-            "id": fields.Integer,
-            "slack_user_id": fields.String,
-            "first_name": fields.String,
-            "last_name": fields.String,
-            "ghost_user_id": fields.String,
-            "display_name": fields.String,
-        }
+    Parsers are built once per Resource class rather than per request;
+    subclasses that accept arguments declare them via _build_parser in
+    the class body.
+    """
 
-        self.parser = reqparse.RequestParser(bundle_errors=True)
+    parser = reqparse.RequestParser(bundle_errors=True)
 
-        super().__init__(*args, **kwargs)
+    BASE_FIELDS = {
+        "id": fields.Integer,
+        "slack_user_id": fields.String,
+        "first_name": fields.String,
+        "last_name": fields.String,
+        "ghost_user_id": fields.String,
+        "display_name": fields.String,
+    }
 
-    @property
-    def get_quotes_field_type(self):
-        return fields.List(fields.String(attribute="content"))
+    INCLUDABLE_FIELDS = {
+        "quotes": fields.List(fields.String(attribute="content")),
+    }
 
 
 class PersonResource(PersonResourceBase):
@@ -115,63 +257,39 @@ class PersonResource(PersonResourceBase):
     person by a `slack_user_id`.
     """
 
-    ERRORS = {
-        "does_not_exist": "Person with user_id {user_id} does not exist",
-        "already_exists": "Person with id {user_id} already exists",
-    }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.parser.add_argument(
-            "slack_user_id",
-            dest="slack_user_id",
-            type=str,
-        )
-        self.parser.add_argument(
-            "first_name",
-            dest="first_name",
-            type=str,
-        )
-        self.parser.add_argument(
-            "last_name",
-            dest="last_name",
-            type=str,
-        )
-        self.parser.add_argument(
-            "ghost_user_id",
-            dest="ghost_user_id",
-            type=str,
-        )
-        self.parser.add_argument(
-            "display_name",
-            dest="display_name",
-            type=str,
-        )
+    parser = _build_parser(
+        {"name": "slack_user_id", "type": str},
+        {"name": "first_name", "type": str},
+        {"name": "last_name", "type": str},
+        {"name": "ghost_user_id", "type": str},
+        {"name": "display_name", "type": str},
+    )
 
     def get(self, user_id):
-        person, is_active = get_person(user_id)
+        person, is_active = get_person(user_id, eager_quotes="quotes" in self.fields)
 
         if person is None:
-            abort(404, message=self.ERRORS["does_not_exist"].format(user_id=user_id))
+            abort(404, message=f"Person with user_id {user_id} does not exist")
 
-        return marshal(person, self.fields), 200
+        return fast_marshal(person, self.fields), 200
 
     def delete(self, user_id):
-        person, is_active = get_person(user_id)
+        person, is_active = get_person_cached(user_id)
 
         if person is None:
-            abort(404, message=self.ERRORS["does_not_exist"].format(user_id=user_id))
+            abort(404, message=f"Person with user_id {user_id} does not exist")
 
         remove_user(person)
 
         return None, 204
 
     def patch(self, user_id):
-        person, is_active = get_person(user_id)
+        # Lock the row so concurrent patches serialize instead of clobbering
+        # each other's reads.
+        person, is_active = get_person(user_id, for_update=True)
 
         if person is None:
-            abort(404, message=self.ERRORS["does_not_exist"].format(user_id=user_id))
+            abort(404, message=f"Person with user_id {user_id} does not exist")
 
         parsed_args = self.parser.parse_args()
         kwargs = {
@@ -191,12 +309,9 @@ class PersonResource(PersonResourceBase):
             updated_person = update_person(person, **kwargs)
         except IntegrityError:
             id = kwargs.get("ghost_user_id") or kwargs.get("slack_user_id")
-            return abort(
-                409,
-                message=self.ERRORS.get("already_exists").format(user_id=id),
-            )
+            return abort(409, message=f"Person with id {id} already exists")
 
-        return marshal(updated_person, self.fields), 200
+        return fast_marshal(updated_person, self.fields), 200
 
 
 class PersonListResource(PersonResourceBase):
@@ -208,50 +323,33 @@ class PersonListResource(PersonResourceBase):
     The `post` method is implemented to create a new Person.
     """
 
-    ERRORS = {
-        "ghost_user_id_missing": "ghost_user_id is required",
-        "first_name_missing": "first_name is required",
-        "already_exists": "Person with id {slack_user_id} or {ghost_user_id} already exists",
-    }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.parser.add_argument(
-            "slack_user_id",
-            dest="slack_user_id",
-            type=str,
-        )
-        self.parser.add_argument(
-            "first_name",
-            dest="first_name",
-            required=True,
-            type=str,
-            help=self.ERRORS.get("first_name_missing"),
-        )
-        self.parser.add_argument(
-            "last_name",
-            dest="last_name",
-            type=str,
-        )
-        self.parser.add_argument(
-            "ghost_user_id",
-            dest="ghost_user_id",
-            required=True,
-            type=str,
-            help=self.ERRORS.get("ghost_user_id_missing"),
-        )
-        self.parser.add_argument(
-            "display_name",
-            dest="display_name",
-            type=str,
-        )
+    parser = _build_parser(
+        {"name": "slack_user_id", "type": str},
+        {
+            "name": "first_name",
+            "required": True,
+            "type": str,
+            "help": "first_name is required",
+        },
+        {"name": "last_name", "type": str},
+        {
+            "name": "ghost_user_id",
+            "required": True,
+            "type": str,
+            "help": "ghost_user_id is required",
+        },
+        {"name": "display_name", "type": str},
+    )
 
     def get(self):
-        people = get_all_people()
-        return marshal(people, self.fields), 200
+        people = get_all_people(
+            eager_quotes="quotes" in self.fields, columns=tuple(self.fields)
+        )
+        return fast_marshal(people, self.fields), 200
 
     def post(self):
+        reject_malformed_body()
+
         parsed_args = self.parser.parse_args()
         slack_user_id = parsed_args.get("slack_user_id")
         first_name = parsed_args.get("first_name")
@@ -280,30 +378,47 @@ class PersonListResource(PersonResourceBase):
         except IntegrityError:
             return abort(
                 409,
-                message=self.ERRORS.get("already_exists").format(
-                    slack_user_id=slack_user_id, ghost_user_id=ghost_user_id
-                ),
+                message=f"Person with id {slack_user_id} or {ghost_user_id} already exists",
             )
 
-        return marshal(new_person, self.fields), 201
+        # RFC 7240: clients that only need the id can skip marshalling.
+        if request.headers.get("Prefer") == "return=minimal":
+            return {"id": new_person.id}, 201
+
+        return fast_marshal(new_person, self.fields), 201
+
+
+class IsoDateTime(fields.Raw):
+    """
+    Marshal a datetime as an ISO 8601 string.
+
+    fields.DateTime defaults to RFC822 rendering via
+    email.utils.formatdate, one of the slowest formatters in
+    flask_restful's field set; datetime.isoformat is a single C call.
+    """
+
+    def format(self, value):
+        return value.isoformat()
 
 
 class QuoteResourceBase(Resource):
     """
     A base class for the Quote resource to define common properties and methods.
-    """
 
-    def __init__(self, *args, **kwargs):
-        self.fields = {
-            "id": fields.Integer,
-            "content": fields.String,
-            "person_id": fields.Integer(),
-            "created": fields.DateTime,
-        }
+    Parsers are built once per Resource class rather than per request;
+    subclasses that accept arguments declare them via _build_parser in
+    the class body.
+    """
 
-        self.parser = reqparse.RequestParser(bundle_errors=True)
+    parser = reqparse.RequestParser(bundle_errors=True)
 
-        super().__init__(*args, **kwargs)
+    # Shared across requests; nothing mutates this at request time.
+    fields = {
+        "id": fields.Integer,
+        "content": fields.String,
+        "person_id": fields.Integer(),
+        "created": IsoDateTime,
+    }
 
 
 class PersonQuoteResource(QuoteResourceBase):
@@ -313,52 +428,37 @@ class PersonQuoteResource(QuoteResourceBase):
     The `get` method is implemented to get a Quote by it's id from a Person.
     """
 
-    ERRORS = {
-        "person_does_not_exist": ("Person with user_id {user_id} does not exist"),
-        "quote_does_not_exist": (
-            "Quote with id {quote_id} does not exist for " "person with user_id {user_id}"
-        ),
-    }
+    def _get_quote_or_404(self, user_id, quote_id):
+        """
+        Resolve this route's Person and Quote, aborting with 404 when
+        either is missing.
 
-    def get(self, user_id, quote_id):
-        person, is_active = get_person(user_id)
+        Shared by get and delete; messages are f-strings so nothing is
+        parsed on the error path beyond the interpolation itself.
+        """
+        person, quote = get_person_and_quote(user_id, quote_id)
 
         if person is None:
-            abort(
-                404,
-                message=self.ERRORS["person_does_not_exist"].format(user_id=user_id),
-            )
-
-        quote = get_quote_from_person(person, quote_id)
+            abort(404, message=f"Person with user_id {user_id} does not exist")
 
         if quote is None:
             abort(
                 404,
-                message=self.ERRORS["quote_does_not_exist"].format(
-                    quote_id=quote_id, user_id=user_id
+                message=(
+                    f"Quote with id {quote_id} does not exist for "
+                    f"person with user_id {user_id}"
                 ),
             )
 
-        return marshal(quote, self.fields), 200
-
-    def delete(self, user_id, quote_id):
-        person, is_active = get_person(user_id)
+        return quote
 
-        if person is None:
-            abort(
-                404,
-                message=self.ERRORS["person_does_not_exist"].format(user_id=user_id),
-            )
+    def get(self, user_id, quote_id):
+        quote = self._get_quote_or_404(user_id, quote_id)
 
-        quote = get_quote_from_person(person, quote_id)
+        return fast_marshal(quote, self.fields), 200
 
-        if quote is None:
-            abort(
-                404,
-                message=self.ERRORS["quote_does_not_exist"].format(
-                    quote_id=quote_id, user_id=user_id
-                ),
-            )
+    def delete(self, user_id, quote_id):
+        quote = self._get_quote_or_404(user_id, quote_id)
 
         delete_quote(quote)
 
@@ -372,22 +472,30 @@ class PersonQuoteListResource(QuoteResourceBase):
     The `get` method is implemented to get all Quotes from a Person.
     """
 
-    ERRORS = {
-        "person_does_not_exist": "Person with user_id {user_id} does not exist",
-    }
-
     def get(self, user_id):
-        person, is_active = get_person(user_id)
+        person, is_active = get_person_cached(user_id)
 
         if person is None:
-            abort(
-                404,
-                message=self.ERRORS["person_does_not_exist"].format(user_id=user_id),
-            )
+            abort(404, message=f"Person with user_id {user_id} does not exist")
 
-        quotes = get_all_quotes_from_person(person)
+        marshal_one = _make_marshaller(tuple(self.fields.items()))
 
-        return marshal(quotes, self.fields), 200
+        if orjson is not None:
+            dumps = orjson.dumps
+        else:
+            dumps = lambda obj: json.dumps(obj, separators=(",", ":")).encode()  # noqa: E731
+
+        def generate():
+            # Stream one marshalled quote at a time so a person with a
+            # huge history never has their whole list in memory.
+            yield b"["
+            for i, quote in enumerate(iter_quotes_from_person(person)):
+                if i:
+                    yield b","
+                yield dumps(marshal_one(quote))
+            yield b"]"
+
+        return Response(stream_with_context(generate()), mimetype="application/json")
 
 
 class QuoteListResource(QuoteResourceBase):
@@ -397,59 +505,50 @@ class QuoteListResource(QuoteResourceBase):
     The `post` method is implemented to create a new Quote.
     """
 
-    ERRORS = {
-        "user_id_missing": "user_id is required",
-        "content_missing": "content is required",
-        "person_does_not_exist": (
-            "Can't add a quote to Person with user_id " "{user_id} because they don't exist."
-        ),
-        "already_exists": (
-            "The Quote content provided can't be added because "
-            "it already exists for this Person."
-        ),
-    }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.parser.add_argument(
-            "user_id",
-            dest="user_id",
-            required=True,
-            type=str,
-            help=self.ERRORS.get("user_id_missing"),
-        )
-        self.parser.add_argument(
-            "content",
-            dest="content",
-            required=True,
-            type=str,
-            help=self.ERRORS.get("content_missing"),
-        )
+    parser = _build_parser(
+        {
+            "name": "user_id",
+            "required": True,
+            "type": str,
+            "help": "user_id is required",
+        },
+        {
+            "name": "content",
+            "required": True,
+            "type": str,
+            "help": "content is required",
+        },
+    )
 
     def post(self):
+        reject_malformed_body()
+
         parsed_args = self.parser.parse_args()
         user_id = parsed_args.get("user_id")
         content = parsed_args.get("content")
 
-        target_person, is_active = get_person(user_id)
+        target_person, already_said = get_person_and_has_said(user_id, content)
 
         if not target_person:
             return abort(
                 404,
-                message=self.ERRORS.get("person_does_not_exist").format(user_id=user_id),
+                message=(
+                    f"Can't add a quote to Person with user_id "
+                    f"{user_id} because they don't exist."
+                ),
             )
 
+        if already_said:
+            return abort(409, message=QUOTE_ALREADY_EXISTS)
+
         data = AddQuoteDTO(target_person, content)
-        try:
-            new_quote = add_quote_to_person(data)
-        except QuoteAlreadyExistsException:
-            return abort(
-                409,
-                message=self.ERRORS.get("already_exists").format(user_id=user_id),
-            )
+        new_quote = add_quote_to_person(data, check_duplicate=False)
+
+        # RFC 7240: clients that only need the id can skip marshalling.
+        if request.headers.get("Prefer") == "return=minimal":
+            return {"id": new_quote.id}, 201
 
-        return marshal(new_quote, self.fields), 201
+        return fast_marshal(new_quote, self.fields), 201
 
 
 class QuoteResource(QuoteResourceBase):
@@ -457,36 +556,10 @@ class QuoteResource(QuoteResourceBase):
     Implements the API methods for operating on singular Quotes.
     """
 
-    ERRORS = {
-        "user_id_missing": "user_id is required",
-        "content_missing": "content is required",
-        "person_does_not_exist": (
-            "Can't add a quote to Person with user_id " "{user_id} because they don't exist."
-        ),
-        "quote_does_not_exist": (
-            "Can't find a quote with quote_id " "{quote_id} because it don't exist."
-        ),
-        "already_exists": (
-            "The Quote content provided can't be added because "
-            "it already exists for this Person."
-        ),
-    }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-
-        self.parser.add_argument(
-            "user_id",
-            dest="user_id",
-            type=str,
-            help=self.ERRORS.get("user_id_missing"),
-        )
-        self.parser.add_argument(
-            "content",
-            dest="content",
-            type=str,
-            help=self.ERRORS.get("content_missing"),
-        )
+    parser = _build_parser(
+        {"name": "user_id", "type": str, "help": "user_id is required"},
+        {"name": "content", "type": str, "help": "content is required"},
+    )
 
     def get(self, quote_id):
         quote = get_quote(quote_id)
@@ -494,16 +567,16 @@ class QuoteResource(QuoteResourceBase):
         if quote is None:
             abort(
                 404,
-                message=self.ERRORS["quote_does_not_exist"].format(quote_id=quote_id),
+                message=f"Can't find a quote with quote_id {quote_id} because it don't exist.",
             )
-        return marshal(quote, self.fields), 200
+        return fast_marshal(quote, self.fields), 200
 
     def patch(self, quote_id):
         quote = get_quote(quote_id)
         if quote is None:
             abort(
                 404,
-                message=self.ERRORS["quote_does_not_exist"].format(quote_id=quote_id),
+                message=f"Can't find a quote with quote_id {quote_id} because it don't exist.",
             )
 
         parsed_args = self.parser.parse_args()
@@ -511,14 +584,17 @@ class QuoteResource(QuoteResourceBase):
         content = parsed_args.get("content")
 
         if user_id:
-            target_person, is_active = get_person(user_id)
+            target_person, is_active = get_person_cached(user_id)
         else:
             target_person = get_person_by_quote(quote)
 
         if not target_person:
             return abort(
                 404,
-                message=self.ERRORS.get("person_does_not_exist").format(user_id=user_id),
+                message=(
+                    f"Can't add a quote to Person with user_id "
+                    f"{user_id} because they don't exist."
+                ),
             )
 
         if not content:
@@ -532,17 +608,18 @@ class QuoteResource(QuoteResourceBase):
         try:
             updated_quote = update_quote(quote, **kwargs)
         except QuoteAlreadyExistsException:
-            return abort(
-                409,
-                message=self.ERRORS.get("already_exists").format(user_id=user_id),
-            )
+            return abort(409, message=QUOTE_ALREADY_EXISTS)
 
-        return marshal(updated_quote, self.fields), 200
+        return fast_marshal(updated_quote, self.fields), 200
 
 
-api.add_resource(PersonListResource, "/people")
-api.add_resource(PersonResource, "/people/<string:user_id>")
-api.add_resource(PersonQuoteListResource, "/people/<string:user_id>/quotes")
-api.add_resource(PersonQuoteResource, "/people/<string:user_id>/quotes/<string:quote_id>")
-api.add_resource(QuoteListResource, "/quotes")
-api.add_resource(QuoteResource, "/quotes/<string:quote_id>")
+# strict_slashes=False serves /people and /people/ alike instead of
+# 308-redirecting one of them, saving misrouted clients a round trip.
+api.add_resource(PersonListResource, "/people", strict_slashes=False)
+api.add_resource(PersonResource, "/people/<string:user_id>", strict_slashes=False)
+api.add_resource(PersonQuoteListResource, "/people/<string:user_id>/quotes", strict_slashes=False)
+api.add_resource(
+    PersonQuoteResource, "/people/<string:user_id>/quotes/<int:quote_id>", strict_slashes=False
+)
+api.add_resource(QuoteListResource, "/quotes", strict_slashes=False)
+api.add_resource(QuoteResource, "/quotes/<int:quote_id>", strict_slashes=False)
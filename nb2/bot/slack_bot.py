@@ -1,5 +1,8 @@
 import re
+import threading
+import time
 from collections import namedtuple
+from itertools import cycle
 from typing import Tuple
 
 from slack import WebClient
@@ -13,12 +16,20 @@ from nb2.service.person_service import create_person, get_person, get_person_by_
 from nb2.service.quote_service import (
     add_quote_to_person,
     get_random_quote_from_any_person,
+    get_random_quotes_for_people,
     get_random_quotes_from_person,
     has_quotes,
 )
 from nb2.service.slack_service import mention_users, trim_mention
 
 
+def _person_repr(person: Person) -> str:
+    """
+    Return the identifier converse keys a Person's quotes and name by.
+    """
+    return person.slack_user_id or person.display_name or person.ghost_user_id
+
+
 class SlackBot:
     """
     A class representing Nostalgiabot's interface with Slack.
@@ -31,33 +42,87 @@ class SlackBot:
     Result = namedtuple("Result", ["ok", "message"])
 
     # remember (that|when) <slack_user_id|display_name|ghost_user_id> said "some quote"
-    REMEMBER_REGEX = (
-        '^remember\\s+((that\\s+)|(when\\s+))?(?P<user_id>\\w+|<@\\w+>)\\s+said\\s+"(?P<quote>.*)"$'
+    # Compiled once at class definition so the hot path doesn't pay a
+    # pattern-cache lookup on every command.
+    REMEMBER_REGEX = re.compile(
+        "^remember\\s+((that\\s+)|(when\\s+))?"
+        '(?P<user_id>\\w+|<@\\w+>)\\s+said\\s+"(?P<quote>.*)"$',
+        re.I,
     )
 
     # remind (me | <@user_id_to_remind>+ ) of <slack_user_id|display_name|ghost_user_id>
-    REMIND_REGEX = (
+    # Compiled once at class definition so the hot path doesn't pay a
+    # pattern-cache lookup on every command.
+    REMIND_REGEX = re.compile(
         "^remind\\s+(?P<slack_user_targets>me|(<@\\w+>\\s*)+)\\s+"
-        "of\\s+(?P<nostalgia_user_target>\\w+|<@\\w+>)$"
+        "of\\s+(?P<nostalgia_user_target>\\w+|<@\\w+>)$",
+        re.I,
     )
 
     # quote <slack_user_id|display_name|ghost_user_id>
-    QUOTE_REGEX = "^quote\\s+(?P<nostalgia_user_target>\\w+|<@\\w+>)$"
+    QUOTE_REGEX = re.compile("^quote\\s+(?P<nostalgia_user_target>\\w+|<@\\w+>)$", re.I)
 
     # random quote
-    RANDOM_REGEX = "^random\\s+quote$"
+    RANDOM_REGEX = re.compile("^random\\s+quote$", re.I)
 
     # converse <slack_user_id|display_name|ghost_user_id>{2,}
-    CONVERSE_REGEX = (
-        "^converse\\s+(?P<nostalgia_user_targets>(\\w+|<@\\w+>)(,\\s*(\\w+|<@\\w+>))+)$"
+    CONVERSE_REGEX = re.compile(
+        "^converse\\s+(?P<nostalgia_user_targets>(\\w+|<@\\w+>)(,\\s*(\\w+|<@\\w+>))+)$",
+        re.I,
     )
 
+    # Greetings recognized by is_hello; a frozenset so the membership test
+    # on every inbound command is a single hash lookup.
+    VALID_GREETINGS = frozenset({"hello", "greetings", "salutations", "howdy"})
+
+    # How long (seconds) a fetched Slack user-info payload stays fresh in
+    # the per-instance cache before we hit the API again, and how many
+    # users the cache holds before the oldest entries are evicted.
+    USER_INFO_CACHE_TTL = 300
+    USER_INFO_CACHE_MAXSIZE = 1024
+
     def __init__(self):
         self.web_client = None
         self.slack_user_id = None
+        # (slack_user_id, compiled mention pattern); rebuilt only if the
+        # bot's id changes. See _remove_bot_user_id_reference.
+        self._bot_mention_regex = None
+        # slack_user_id -> (expiry, payload); see fetch_user_info. The
+        # lock keeps reads and evictions consistent when actions run on
+        # worker threads.
+        self._user_info_cache = {}
+        self._user_info_cache_lock = threading.Lock()
+        # channel -> Lock; keeps at most one chat_postMessage in flight
+        # per channel so concurrent worker threads can't interleave a
+        # channel's messages. dict.setdefault is atomic under the GIL.
+        self._channel_send_locks = {}
+        # Ordered (predicate, action, send) table consulted by run_action;
+        # the first matching predicate wins. Actions take (command, sender)
+        # so entries stay uniform even when one of them is unused.
+        self._dispatch = (
+            (self.is_hello, lambda command, sender: self.hello(), self.send_text),
+            (self.is_help, lambda command, sender: self.help(), self.send_blocks),
+            (
+                self.is_remember_action,
+                lambda command, sender: self.remember(command),
+                self.send_text,
+            ),
+            (self.is_quote_action, lambda command, sender: self.quote(command), self.send_text),
+            (self.is_remind_action, self.remind, self.send_text),
+            (self.is_random_action, lambda command, sender: self.random(), self.send_text),
+            (
+                self.is_converse_action,
+                lambda command, sender: self.converse(command),
+                self.send_text,
+            ),
+        )
 
     def init_app(self, token):
-        self.web_client = WebClient(token=token)
+        # One WebClient for the bot's lifetime: the SDK keeps its HTTP
+        # connections alive, so reusing the instance amortizes TLS
+        # handshakes across calls. The timeout bounds how long a worker
+        # thread can hang on a stalled Slack call.
+        self.web_client = WebClient(token=token, timeout=30)
 
     def _init_bot_slack_user_id(self):
         """
@@ -73,12 +138,17 @@ class SlackBot:
         the message. If all is True, remove all references of the bot user id.
         """
         target_token = self.get_bot_slack_user_id()
-        regex_pattern = f"<@{target_token}>\\s*"
-        count = 0 if all_occurrences else 1
 
-        result = re.sub(regex_pattern, "", message, count=count)
+        cached = self._bot_mention_regex
+        if cached is None or cached[0] != target_token:
+            # re.escape in case Slack ever hands back an id containing a
+            # regex metacharacter.
+            cached = (target_token, re.compile(f"<@{re.escape(target_token)}>\\s*"))
+            self._bot_mention_regex = cached
 
-        return result
+        count = 0 if all_occurrences else 1
+
+        return cached[1].sub("", message, count=count)
 
     def get_bot_slack_user_id(self) -> str:
         """
@@ -109,34 +179,16 @@ class SlackBot:
         command = payload.get("event").get("text")
         command = self._remove_bot_user_id_reference(command, all_occurrences=True)
         command = command.strip()
+        # Lowercase once for matching instead of per-predicate; the regex
+        # matchers are case-insensitive anyway, and this makes hello/help
+        # match regardless of case too. Actions still get the original
+        # command so quote content keeps the sender's casing.
+        command_lower = command.lower()
 
-        if self.is_hello(command):
-            result = self.hello()
-            return self.send_text(result.message, channel)
-
-        if self.is_help(command):
-            result = self.help()
-            return self.send_blocks(result.message, channel)
-
-        if self.is_remember_action(command):
-            result = self.remember(command)
-            return self.send_text(result.message, channel)
-
-        if self.is_quote_action(command):
-            result = self.quote(command)
-            return self.send_text(result.message, channel)
-
-        if self.is_remind_action(command):
-            result = self.remind(command, sender)
-            return self.send_text(result.message, channel)
-
-        if self.is_random_action(command):
-            result = self.random()
-            return self.send_text(result.message, channel)
-
-        if self.is_converse_action(command):
-            result = self.converse(command)
-            return self.send_text(result.message, channel)
+        for matches, action, send in self._dispatch:
+            if matches(command_lower):
+                result = action(command, sender)
+                return send(result.message, channel)
 
         return self.send_text(self.unknown_error.message, channel)
 
@@ -188,7 +240,7 @@ class SlackBot:
         Returns:
             A Result namedtuple.
         """
-        matched = re.match(self.REMEMBER_REGEX, message, re.I)
+        matched = self.REMEMBER_REGEX.match(message)
 
         target_user_id = trim_mention(matched.group("user_id"))
         quote = matched.group("quote")
@@ -292,7 +344,7 @@ class SlackBot:
         Returns:
             A Result namedtuple.
         """
-        matched = re.match(self.QUOTE_REGEX, message, re.I)
+        matched = self.QUOTE_REGEX.match(message)
 
         nostalgia_user_target = trim_mention(matched.group("nostalgia_user_target"))
 
@@ -325,7 +377,7 @@ class SlackBot:
         Returns:
             A Result namedtuple.
         """
-        matched = re.match(self.REMIND_REGEX, message, re.I)
+        matched = self.REMIND_REGEX.match(message)
 
         slack_user_targets = trim_mention(matched.group("slack_user_targets").split())
         nostalgia_user_target = trim_mention(matched.group("nostalgia_user_target"))
@@ -346,11 +398,11 @@ class SlackBot:
             return self.Result(ok=True, message=f"I don't remember <@{person}>.")
 
         # Replace "me" with the sender slack_user_id so that the sender can be pinged
-        slack_user_targets = [sender if target == "me" else target for target in slack_user_targets]
-
-        message = (
-            f"{mention_users(slack_user_targets)} Do you remember this?\n\n" f'"{quote}" - {person}'
+        mentions = mention_users(
+            sender if target == "me" else target for target in slack_user_targets
         )
+
+        message = f'{mentions} Do you remember this?\n\n"{quote}" - {person}'
         return self.Result(ok=True, message=message)
 
     def random(self) -> Result:
@@ -380,14 +432,11 @@ class SlackBot:
         - The above is already verified by is_converse_action, however.
         """
 
-        def get_person_repr(person: Person) -> str:
-            return person.slack_user_id or person.display_name or person.ghost_user_id
-
         QUOTES_PER_PERSON = 2
-        matched = re.match(self.CONVERSE_REGEX, message, re.I)
+        matched = self.CONVERSE_REGEX.match(message)
 
         nostalgia_user_targets = trim_mention(
-            re.split(",\\s+", matched.group("nostalgia_user_targets"))
+            [target.strip() for target in matched.group("nostalgia_user_targets").split(",")]
         )
         persons = [get_person(target) for target in nostalgia_user_targets]
 
@@ -406,39 +455,36 @@ class SlackBot:
                 person = self.update_person(person)
             updated_persons.append(person)
 
-        quotes_by_slack_user_id = {
-            get_person_repr(person): get_random_quotes_from_person(person, QUOTES_PER_PERSON)
-            for person in updated_persons
-        }
-
-        names_by_slack_user_id = {
-            get_person_repr(person): person.first_name for person in updated_persons
-        }
-
-        slack_user_ids_with_no_quotes = [
-            slack_user_id
-            for slack_user_id in quotes_by_slack_user_id
-            if not quotes_by_slack_user_id.get(slack_user_id)
-        ]
+        quotes_by_person_id = get_random_quotes_for_people(updated_persons, QUOTES_PER_PERSON)
+
+        # Single pass: split targets into speakers and quoteless users.
+        # Dicts keyed on the person repr so repeated targets collapse to
+        # one speaker, as they did when these were separate dict passes.
+        speakers = {}
+        missing = {}
+        for person in updated_persons:
+            person_repr = _person_repr(person)
+            quotes = quotes_by_person_id.get(person.id)
+            if quotes:
+                # Since not every person may have the same amount of quotes, if they run out
+                # during the iteration, then just loop back and reuse quotes in order
+                speakers[person_repr] = (person.first_name, cycle(quotes))
+            else:
+                missing[person_repr] = None
 
-        if any(slack_user_ids_with_no_quotes):
+        if missing:
             # TODO / Nice to have: Only @ when it's not a ghost user
-            missing_people = ", ".join(f"<@{user}>" for user in slack_user_ids_with_no_quotes)
+            missing_people = ", ".join(f"<@{user}>" for user in missing)
             message = f"I don't remember {missing_people}."
             return self.Result(ok=False, message=message)
 
-        message = ""
+        lines = []
 
-        for i in range(QUOTES_PER_PERSON):
-            for slack_user_id in quotes_by_slack_user_id:
-                name = names_by_slack_user_id[slack_user_id]
-                num_quotes_for_person = len(quotes_by_slack_user_id[slack_user_id])
-                # Since not every person may have the same amount of quotes, if they run out
-                # during the iteration, then just loop back and reuse quotes in order
-                quote = quotes_by_slack_user_id[slack_user_id][i % num_quotes_for_person].content
-                message += f"{name}: {quote}\n"
+        for _ in range(QUOTES_PER_PERSON):
+            for name, quotes in speakers.values():
+                lines.append(f"{name}: {next(quotes).content}\n")
 
-        return self.Result(ok=True, message=message)
+        return self.Result(ok=True, message="".join(lines))
 
     #############################
     # Action matching functions
@@ -451,11 +497,9 @@ class SlackBot:
         The valid form for a hello is:
         "<@NB_user_id> <greeting>"
 
-        where <greeting> is a word in valid_greetings.
+        where <greeting> is a word in VALID_GREETINGS.
         """
-        valid_greetings = ["hello", "greetings", "salutations", "howdy"]
-
-        return command in valid_greetings
+        return command in self.VALID_GREETINGS
 
     def is_help(self, command: str) -> bool:
         """
@@ -479,7 +523,7 @@ class SlackBot:
         - Only one target user is allowed.
         - Quote content (".*") must be encapsulated in double quotes.
         """
-        return re.match(self.REMEMBER_REGEX, command, re.I) is not None
+        return self.REMEMBER_REGEX.match(command) is not None
 
     def is_quote_action(self, command: str) -> bool:
         """
@@ -491,7 +535,7 @@ class SlackBot:
         Notes:
         - Only one target user is allowed.
         """
-        return re.match(self.QUOTE_REGEX, command, re.I) is not None
+        return self.QUOTE_REGEX.match(command) is not None
 
     def is_remind_action(self, command: str) -> bool:
         """
@@ -507,7 +551,7 @@ class SlackBot:
           tag  <@user_id_to_remind>
         - Only one <@user_id_to_remember> is allowed.
         """
-        return re.match(self.REMIND_REGEX, command, re.I) is not None
+        return self.REMIND_REGEX.match(command) is not None
 
     def is_random_action(self, command: str) -> bool:
         """
@@ -519,7 +563,7 @@ class SlackBot:
         Notes:
         - Only one target user is allowed.
         """
-        return re.match(self.RANDOM_REGEX, command, re.I) is not None
+        return self.RANDOM_REGEX.match(command) is not None
 
     def is_converse_action(self, command: str) -> bool:
         """
@@ -531,17 +575,19 @@ class SlackBot:
         Notes:
         - There must be at least two <@target_user_id>s
         """
-        return re.match(self.CONVERSE_REGEX, command, re.I) is not None
+        return self.CONVERSE_REGEX.match(command) is not None
 
     #############################
     # External Slack Methods
     #############################
 
     def send_text(self, text, channel):
-        self.web_client.chat_postMessage(text=text, channel=channel)
+        with self._channel_send_locks.setdefault(channel, threading.Lock()):
+            self.web_client.chat_postMessage(text=text, channel=channel)
 
     def send_blocks(self, blocks, channel):
-        self.web_client.chat_postMessage(blocks=blocks, channel=channel)
+        with self._channel_send_locks.setdefault(channel, threading.Lock()):
+            self.web_client.chat_postMessage(blocks=blocks, channel=channel)
 
     def fetch_bot_info(self) -> dict:
         """
@@ -553,13 +599,44 @@ class SlackBot:
         """
         Return Slack's representation of a user with id slack_user_id.
 
+        Results are cached per user for USER_INFO_CACHE_TTL seconds, so
+        commands that keep referencing the same people (e.g. bursts of
+        remember calls) cost one HTTPS round-trip per user instead of
+        one per command. Failed lookups are never cached.
+
         Args:
             slack_user_id: string representing the Person's primary Slack id.
 
         Returns:
             {} containing Slack user information.
         """
-        return self.web_client.users_info(user=slack_user_id).validate().data["user"]
+        with self._user_info_cache_lock:
+            cached = self._user_info_cache.get(slack_user_id)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+        user_info = self.web_client.users_info(user=slack_user_id).validate().data["user"]
+
+        with self._user_info_cache_lock:
+            if len(self._user_info_cache) >= self.USER_INFO_CACHE_MAXSIZE:
+                now = time.monotonic()
+                for user_id in [
+                    user_id
+                    for user_id, (expiry, _) in self._user_info_cache.items()
+                    if expiry <= now
+                ]:
+                    del self._user_info_cache[user_id]
+
+                # Everything is still fresh; drop the oldest insertion.
+                if len(self._user_info_cache) >= self.USER_INFO_CACHE_MAXSIZE:
+                    del self._user_info_cache[next(iter(self._user_info_cache))]
+
+            self._user_info_cache[slack_user_id] = (
+                time.monotonic() + self.USER_INFO_CACHE_TTL,
+                user_info,
+            )
+
+        return user_info
 
     def update_person(self, person: Person):
         """
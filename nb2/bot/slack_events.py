@@ -3,6 +3,7 @@ from flask import current_app as app
 from slackeventsapi import SlackEventAdapter
 
 from nb2 import bot
+from nb2.bot.socket_mode import executor, log_action_error
 
 bp = Blueprint("slack_event_adapter", __name__)
 
@@ -17,10 +18,19 @@ def handle_app_mention(payload):
     A Slackbot event handler that is intended to be mapped to the
     `app_mention` Slack event.
 
+    The heavy lifting runs on the shared worker pool so the webhook can
+    be acknowledged inside Slack's 3-second budget.
+
     TODO
     This currently just responds with a friendly greeting, but
     should be updated to parse commands and respond accordingly.
     """
     event = payload.get("event", {})
     channel = event.get("channel")
-    bot.run_action(payload, channel)
+    flask_app = app._get_current_object()
+
+    def run():
+        with flask_app.app_context():
+            bot.run_action(payload, channel)
+
+    executor.submit(run).add_done_callback(log_action_error)
@@ -1,3 +1,6 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
 from flask import Blueprint
 from slack_sdk.socket_mode import SocketModeClient
 from slack_sdk.socket_mode.request import SocketModeRequest
@@ -7,6 +10,25 @@ from nb2 import bot
 
 bp = Blueprint("slack_socket_mode", __name__)
 
+logger = logging.getLogger(__name__)
+
+# Worker pool that runs actions off the event-receiving thread. Slack
+# expects events to be acknowledged within 3 seconds; run_action can do
+# db work plus several Slack API round-trips, so it runs here instead of
+# holding up the ack. WebClient is thread-safe, so workers can share the
+# bot's client.
+executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="nb2-action")
+
+
+def log_action_error(future):
+    """
+    Done-callback that surfaces exceptions from background actions,
+    which would otherwise be swallowed by the executor.
+    """
+    exception = future.exception()
+    if exception is not None:
+        logger.error("run_action failed", exc_info=exception)
+
 
 class FlaskSocketModeClient(SocketModeClient):
     def __init__(self, app, app_token, web_client):
@@ -27,5 +49,9 @@ class FlaskSocketModeClient(SocketModeClient):
             req.payload["event"]["type"] == "message"
             or req.payload["event"]["type"] == "app_mention"
         ) and req.payload["event"].get("subtype") is None:
-            with self.app.app_context():
-                bot.run_action(req.payload, req.payload["event"]["channel"])
+            future = executor.submit(self._run_action, req.payload)
+            future.add_done_callback(log_action_error)
+
+    def _run_action(self, payload):
+        with self.app.app_context():
+            bot.run_action(payload, payload["event"]["channel"])
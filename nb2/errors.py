@@ -1,18 +1,32 @@
-from flask import jsonify
+import json
+
+from flask import current_app
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 
 def _error_response(status_code, message):
     """
     Helper method for returning an API error response.
+
+    The {"message": ...} envelope is assembled as bytes around the
+    encoded message, so only the string itself goes through the JSON
+    encoder (orjson when available, same fallback as the api
+    representation) and no payload dict is built per error.
     """
-    payload = {
-        'message': message
-    }
+    if orjson is not None:
+        encoded_message = orjson.dumps(message)
+    else:
+        encoded_message = json.dumps(message).encode()
 
-    response = jsonify(payload)
-    response.status_code = status_code
+    body = b'{"message":' + encoded_message + b'}'
 
-    return response
+    return current_app.response_class(
+        body, status=status_code, mimetype="application/json"
+    )
 
 
 def validation_error(message):
@@ -34,4 +48,3 @@ def conflict(message):
     Helper method for raising conflict errors with 409 status code.
     """
     return _error_response(409, message)
-
@@ -52,6 +52,9 @@ class Person(db.Model):
         """
         Check if quote already exists in Nostalgiabot's memory for this Person.
 
+        Runs as an EXISTS query against the (person_id, lower(content))
+        index rather than loading and scanning self.quotes in Python.
+
         Args:
             quote: a string representing something this Person said.
 
@@ -59,7 +62,12 @@ class Person(db.Model):
             True if a Quote record in the db for this Person has the same content
             as quote. False otherwise
         """
-        return any(q for q in self.quotes if q.content.lower() == quote.lower())
+        return db.session.query(
+            Quote.query.filter(
+                Quote.person_id == self.id,
+                db.func.lower(Quote.content) == quote.lower(),
+            ).exists()
+        ).scalar()
 
 
 class Quote(db.Model):
@@ -73,5 +81,10 @@ class Quote(db.Model):
     person_id = db.Column(db.Integer, db.ForeignKey("person.id"), nullable=False)
     created = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
 
+    # Backs the case-insensitive duplicate check when adding a Quote.
+    __table_args__ = (
+        db.Index("ix_quote_person_id_lower_content", person_id, db.func.lower(content)),
+    )
+
     def __repr__(self):
         return f"<Quote: {self.content} | Id: {self.id}>"
@@ -4,21 +4,23 @@ from nb2.models import Person
 
 
 class BaseDTO:
-    REQUIRED_FIELDS = []
+    # frozensets so the per-field membership test in
+    # get_empty_required_fields is a hash lookup, not a list scan.
+    REQUIRED_FIELDS = frozenset()
 
     def get_empty_fields(self):
         """
         Return a list of field names that have a value of None.
         """
-        return [f for f in self.__dict__ if not self.__dict__[f]]
+        return [f for f, value in self.__dict__.items() if not value]
 
     def get_empty_required_fields(self):
         """
         Return a list of field names that have a value of None
         and are listed in REQUIRED_FIELDS.
         """
-        empty_fields = self.get_empty_fields()
-        return [f for f in empty_fields if f in self.REQUIRED_FIELDS]
+        required = self.REQUIRED_FIELDS
+        return [f for f, value in self.__dict__.items() if not value and f in required]
 
 
 @dataclass
@@ -31,7 +33,7 @@ class CreatePersonDTO(BaseDTO):
         first_name: string representing Person's first name.
     """
 
-    REQUIRED_FIELDS = ["slack_user_id", "first_name", "ghost_user_id"]
+    REQUIRED_FIELDS = frozenset({"slack_user_id", "first_name", "ghost_user_id"})
 
     slack_user_id: str
     first_name: str
@@ -50,7 +52,7 @@ class CreateGhostPersonDTO(BaseDTO):
         first_name: string representing Person's first name.
     """
 
-    REQUIRED_FIELDS = ["ghost_user_id", "first_name"]
+    REQUIRED_FIELDS = frozenset({"ghost_user_id", "first_name"})
 
     ghost_user_id: str
     first_name: str
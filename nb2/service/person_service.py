@@ -1,29 +1,75 @@
 from typing import Tuple, Union
 
+from flask import current_app
+from sqlalchemy.orm import load_only, raiseload, selectinload
+
 from nb2 import db
 from nb2.models import Person, Quote
 from nb2.service.dtos import CreateGhostPersonDTO, CreatePersonDTO
 from nb2.service.exceptions import EmptyRequiredFieldException
-from nb2.service.quote_service import get_all_quotes_from_person
 
 
-def get_all_people():
+def _person_query(eager_quotes: bool = False, for_update: bool = False):
+    """
+    Return the base Person query, optionally eager loading quotes.
+
+    Eager loading uses selectinload so callers that go on to read
+    person.quotes issue one batched query instead of one per Person.
+    for_update adds SELECT ... FOR UPDATE so read-modify-write callers
+    hold the row until commit (a no-op on sqlite).
+    """
+    query = Person.query
+
+    if eager_quotes:
+        query = query.options(selectinload(Person.quotes))
+
+    if for_update:
+        query = query.with_for_update()
+
+    return query
+
+
+def get_all_people(eager_quotes: bool = False, columns=None):
     """
     Return a list of all Person objects in the database.
 
+    Args:
+        eager_quotes: If True, load each Person's quotes in the same
+        round trip instead of lazily per Person.
+        columns: Optional iterable of column names to fetch; anything
+        that isn't a Person column (e.g. the api's quotes field) is
+        ignored. Remaining columns are deferred, so the SELECT only
+        carries what the caller will serialize.
+
     Returns:
         List of Person objects in the database.
         Empty list if no People in the database.
     """
-    return Person.query.all()
+    query = _person_query(eager_quotes)
+
+    if columns:
+        projected = [c for c in columns if c in Person.__table__.columns]
+        if projected:
+            query = query.options(load_only(*projected))
+
+    # With STRICT_LOADING on (the test config), an un-requested lazy load
+    # on a listing turns into an error instead of a silent N+1.
+    if not eager_quotes and current_app.config.get("STRICT_LOADING"):
+        query = query.options(raiseload("*"))
 
+    return query.all()
 
-def get_person(user_id: str) -> Tuple[Person, bool]:
+
+def get_person(
+    user_id: str, eager_quotes: bool = False, for_update: bool = False
+) -> Tuple[Person, bool]:
     """
     Return Person with slack_user_id, ghost_user_id or display_name equal to user_id.
 
     Args:
         user_id: Either a slack_user_id or a ghost_user_id
+        eager_quotes: If True, load the Person's quotes eagerly.
+        for_update: If True, lock the selected row until commit.
 
     Returns:
         A tuple:
@@ -33,14 +79,29 @@ def get_person(user_id: str) -> Tuple[Person, bool]:
         slack_user_id ("active"), and False if it's referenced via
         display name or ghost_user_id, or no Person is found.
     """
-    slack_user = get_person_by_slack_user_id(user_id)
+    # Numeric ids are primary keys from internal callers; Query.get hits
+    # the identity map and can skip the SELECT entirely. Only safe when
+    # no query options are requested, since a cached instance wouldn't
+    # honor them.
+    if user_id.isdigit() and not (eager_quotes or for_update):
+        person = Person.query.get(int(user_id))
+        if person:
+            return person, bool(person.slack_user_id)
+
+    slack_user = get_person_by_slack_user_id(user_id, eager_quotes, for_update)
     if slack_user:
         return slack_user, True
 
-    return get_person_by_display_name(user_id) or get_person_by_ghost_user_id(user_id), False
+    return (
+        get_person_by_display_name(user_id, eager_quotes, for_update)
+        or get_person_by_ghost_user_id(user_id, eager_quotes, for_update),
+        False,
+    )
 
 
-def get_person_by_slack_user_id(slack_user_id: str):
+def get_person_by_slack_user_id(
+    slack_user_id: str, eager_quotes: bool = False, for_update: bool = False
+):
     """
     Return Person with slack_user_id if it exists.
 
@@ -51,10 +112,14 @@ def get_person_by_slack_user_id(slack_user_id: str):
         Person object if one exists in the db with slack_user_id
         None if no such person exists.
     """
-    return Person.query.filter_by(slack_user_id=slack_user_id).one_or_none()
+    return (
+        _person_query(eager_quotes, for_update).filter_by(slack_user_id=slack_user_id).one_or_none()
+    )
 
 
-def get_person_by_display_name(display_name: str):
+def get_person_by_display_name(
+    display_name: str, eager_quotes: bool = False, for_update: bool = False
+):
     """
     Return Person with display_name if it exists.
 
@@ -65,10 +130,14 @@ def get_person_by_display_name(display_name: str):
         Person object if one exists in the db with ghost_user_id
         None if no such person exists.
     """
-    return Person.query.filter_by(display_name=display_name).one_or_none()
+    return (
+        _person_query(eager_quotes, for_update).filter_by(display_name=display_name).one_or_none()
+    )
 
 
-def get_person_by_ghost_user_id(ghost_user_id: str):
+def get_person_by_ghost_user_id(
+    ghost_user_id: str, eager_quotes: bool = False, for_update: bool = False
+):
     """
     Return Person with ghost_user_id if it exists.
 
@@ -79,7 +148,9 @@ def get_person_by_ghost_user_id(ghost_user_id: str):
         Person object if one exists in the db with ghost_user_id
         None if no such person exists.
     """
-    return Person.query.filter_by(ghost_user_id=ghost_user_id).one_or_none()
+    return (
+        _person_query(eager_quotes, for_update).filter_by(ghost_user_id=ghost_user_id).one_or_none()
+    )
 
 
 def get_person_name_by_slack_user_id(slack_user_id: str):
@@ -173,11 +244,13 @@ def remove_user(person: Person):
     """
     Remove a Person and their quotes from the db.
 
+    The quotes go in one bulk DELETE instead of being loaded and
+    unit-of-work deleted row by row.
+
     Required args:
         person: A Person.
     """
-    for quote in get_all_quotes_from_person(person):
-        db.session.delete(quote)
+    Quote.query.filter(Quote.person_id == person.id).delete(synchronize_session=False)
 
     db.session.delete(person)
     db.session.commit()
@@ -1,6 +1,10 @@
-from typing import List
+import random
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
 
-from sqlalchemy.sql.expression import func
+from flask import current_app
+from sqlalchemy.orm import raiseload
+from sqlalchemy.sql.expression import and_, func, or_
 
 from nb2 import db
 from nb2.models import Person, Quote
@@ -8,6 +12,29 @@ from nb2.service.dtos import AddQuoteDTO
 from nb2.service.exceptions import EmptyRequiredFieldException, QuoteAlreadyExistsException
 
 
+def person_has_quote(person_id: int, content: str) -> bool:
+    """
+    Check if a Person already has a Quote with this content.
+
+    The comparison is case-insensitive and runs as an EXISTS query so
+    the db answers from the (person_id, lower(content)) index without
+    loading any Quote rows.
+
+    Required Args:
+        person_id: The primary key of a Person.
+        content: The quote content to check for.
+
+    Returns:
+        True if the Person has a Quote with this content, else False.
+    """
+    return db.session.query(
+        Quote.query.filter(
+            Quote.person_id == person_id,
+            func.lower(Quote.content) == content.lower(),
+        ).exists()
+    ).scalar()
+
+
 def get_quote_from_person(person: Person, quote_id: int):
     """
     Get a Quote from a Person.
@@ -27,6 +54,98 @@ def get_quote_from_person(person: Person, quote_id: int):
     )
 
 
+def get_person_and_quote(
+    user_id: str, quote_id: int
+) -> Tuple[Optional[Person], Optional[Quote]]:
+    """
+    Resolve a Person by user_id and one of their Quotes in a single query.
+
+    Replaces the get_person + get_quote_from_person pair (up to four
+    round trips) with one outer-joined SELECT for handlers that need
+    both.
+
+    Required Args:
+        user_id: A slack_user_id, display_name, or ghost_user_id.
+        quote_id: The primary key of a Quote.
+
+    Returns:
+        A (Person, Quote) tuple. Person is None if no Person matches
+        user_id; Quote is None if the Person exists but has no Quote
+        with quote_id.
+    """
+    row = (
+        db.session.query(Person, Quote)
+        .outerjoin(Quote, and_(Quote.person_id == Person.id, Quote.id == quote_id))
+        .filter(
+            or_(
+                Person.slack_user_id == user_id,
+                Person.display_name == user_id,
+                Person.ghost_user_id == user_id,
+            )
+        )
+        # Mirror get_person's precedence if user_id happens to match
+        # different People on different columns.
+        .order_by(
+            (Person.slack_user_id == user_id).desc(),
+            (Person.display_name == user_id).desc(),
+        )
+        .first()
+    )
+
+    if row is None:
+        return None, None
+
+    return row[0], row[1]
+
+
+def get_person_and_has_said(
+    user_id: str, content: str
+) -> Tuple[Optional[Person], bool]:
+    """
+    Resolve a Person by user_id and check if they already said content,
+    in a single query.
+
+    Used by quote creation, which previously ran a person lookup and a
+    separate EXISTS probe back to back.
+
+    Required Args:
+        user_id: A slack_user_id, display_name, or ghost_user_id.
+        content: The quote content to check for (case-insensitive).
+
+    Returns:
+        A (Person, bool) tuple. Person is None when no Person matches
+        user_id, in which case the bool is False.
+    """
+    row = (
+        db.session.query(
+            Person,
+            Quote.query.filter(
+                Quote.person_id == Person.id,
+                func.lower(Quote.content) == content.lower(),
+            ).exists(),
+        )
+        .filter(
+            or_(
+                Person.slack_user_id == user_id,
+                Person.display_name == user_id,
+                Person.ghost_user_id == user_id,
+            )
+        )
+        # Mirror get_person's precedence if user_id happens to match
+        # different People on different columns.
+        .order_by(
+            (Person.slack_user_id == user_id).desc(),
+            (Person.display_name == user_id).desc(),
+        )
+        .first()
+    )
+
+    if row is None:
+        return None, False
+
+    return row[0], bool(row[1])
+
+
 def has_quotes() -> bool:
     """
     Check if there are any quotes in the table.
@@ -71,6 +190,36 @@ def get_random_quotes_from_person(person: Person, num_quotes: int = 1) -> List[Q
     )
 
 
+def get_random_quotes_for_people(
+    people: List[Person], num_quotes: int = 1
+) -> Dict[int, List[Quote]]:
+    """
+    Get up to <num_quotes> random Quote(s) for each of several People.
+
+    Fetches every target's quotes in one query and samples in Python,
+    so callers like converse issue a single round trip instead of one
+    get_random_quotes_from_person call per Person.
+
+    Required Args:
+        people: A list of Person objects.
+        num_quotes: The maximum number of random quotes per Person (defaults to 1).
+
+    Returns:
+        A dict mapping each Person's id to a list of random Quotes.
+        People with no quotes are absent from the dict.
+    """
+    person_ids = [person.id for person in people]
+
+    quotes_by_person_id = defaultdict(list)
+    for quote in Quote.query.filter(Quote.person_id.in_(person_ids)).all():
+        quotes_by_person_id[quote.person_id].append(quote)
+
+    return {
+        person_id: random.sample(quotes, min(num_quotes, len(quotes)))
+        for person_id, quotes in quotes_by_person_id.items()
+    }
+
+
 def get_all_quotes_from_person(person: Person):
     """
     Get all Quote from a Person.
@@ -81,10 +230,42 @@ def get_all_quotes_from_person(person: Person):
     Returns:
         A list of Quote objects.
     """
-    return Quote.query.join(Person).filter(Person.id == person.id).all()
+    # Explicit ordering: without it the row order is whatever index the
+    # planner walks, which is not stable across schema changes.
+    query = Quote.query.join(Person).filter(Person.id == person.id).order_by(Quote.id)
+
+    # With STRICT_LOADING on (the test config), an un-requested lazy load
+    # on a listing turns into an error instead of a silent N+1.
+    if current_app.config.get("STRICT_LOADING"):
+        query = query.options(raiseload("*"))
+
+    return query.all()
+
+
+def iter_quotes_from_person(person: Person, batch_size: int = 500):
+    """
+    Iterate over all Quotes from a Person in fixed-size batches.
+
+    Unlike get_all_quotes_from_person this never materializes the whole
+    result set; yield_per keeps at most batch_size rows in memory, which
+    lets callers stream large histories.
+
+    Required Args:
+        person: A Person.
+        batch_size: Number of rows fetched per round trip.
+
+    Returns:
+        An iterable of Quote objects ordered by id.
+    """
+    query = Quote.query.filter(Quote.person_id == person.id).order_by(Quote.id)
+
+    if current_app.config.get("STRICT_LOADING"):
+        query = query.options(raiseload("*"))
 
+    return query.yield_per(batch_size)
 
-def add_quote_to_person(data: AddQuoteDTO):
+
+def add_quote_to_person(data: AddQuoteDTO, check_duplicate: bool = True):
     """
     Add a Quote to a Person's quotes.
 
@@ -96,6 +277,11 @@ def add_quote_to_person(data: AddQuoteDTO):
     Required Args:
         data: An AddQuoteDTO instance.
 
+    Optional Args:
+        check_duplicate: Pass False when the caller has already verified
+        the content is new (e.g. via get_person_and_has_said) to skip a
+        redundant EXISTS query.
+
     Returns:
         Newly created Quote on success.
 
@@ -116,7 +302,7 @@ def add_quote_to_person(data: AddQuoteDTO):
 
     target_person = data.person
 
-    if target_person.has_said(data.content):
+    if check_duplicate and person_has_quote(target_person.id, data.content):
         raise QuoteAlreadyExistsException
 
     new_quote = Quote()
@@ -4,7 +4,6 @@ from datetime import datetime
 import pytest
 from dateutil.parser import parse
 from flask import url_for
-from flask_restful import fields
 from mixer.backend.flask import mixer
 
 from nb2.models import Person, Quote
@@ -15,7 +14,7 @@ def get_serialized_quote(quote):
         "id": quote.id,
         "content": quote.content,
         "person_id": quote.person_id,
-        "created": fields.DateTime().format(quote.created),
+        "created": quote.created.isoformat(),
     }
 
 
@@ -105,6 +105,21 @@ def test_fetch_user_info(client, session, mock_bot, mocker):
     assert response.get("name") == mock_name
 
 
+def test_fetch_user_info_is_cached(client, session, mock_bot, mocker):
+    mock_slack_user_id = mixer.faker.pystr(10)
+    mock_response = {"user": {"id": mock_slack_user_id}}
+
+    mocked_users_info = mocker.patch.object(
+        mock_bot.web_client, "users_info", return_value=MockSlackResponse(mock_response)
+    )
+
+    first = mock_bot.fetch_user_info(mock_slack_user_id)
+    second = mock_bot.fetch_user_info(mock_slack_user_id)
+
+    assert first == second
+    assert mocked_users_info.call_count == 1
+
+
 @pytest.mark.parametrize(
     "test_message, all_occurrences, expected_result",
     (
@@ -135,8 +150,9 @@ def test_help(client, session, mock_bot):
 
 def test_remember_creates_new_person_if_they_dont_exist(client, session, mock_bot, mocker):
     mock_slack_user_id = mixer.faker.pystr(10)
-    mock_name = mixer.faker.name()
-    first_name, last_name = mock_name.split(" ")
+    first_name = mixer.faker.first_name()
+    last_name = mixer.faker.last_name()
+    mock_name = f"{first_name} {last_name}"
 
     assert Person.query.filter(Person.slack_user_id == mock_slack_user_id).one_or_none() is None
 
@@ -9,6 +9,7 @@ from nb2.service.quote_service import (
     delete_quote,
     get_all_quotes_from_person,
     get_quote_from_person,
+    get_random_quotes_for_people,
     get_random_quotes_from_person,
     update_quote,
 )
@@ -44,6 +45,25 @@ def test_get_random_quotes_from_person_defaults_to_one(client, session):
     assert len(random_quotes) == 1
 
 
+def test_get_random_quotes_for_people(client, session):
+    num_quotes = 2
+    people = mixer.cycle(3).blend(Person, slack_user_id=mixer.RANDOM)
+    expected_quotes_by_person_id = {
+        person.id: mixer.cycle(5).blend(Quote, person=person) for person in people
+    }
+    person_with_no_quotes = mixer.blend(Person, slack_user_id=mixer.RANDOM)
+
+    quotes_by_person_id = get_random_quotes_for_people(
+        people + [person_with_no_quotes], num_quotes
+    )
+
+    assert person_with_no_quotes.id not in quotes_by_person_id
+    for person in people:
+        random_quotes = quotes_by_person_id[person.id]
+        assert set(random_quotes).issubset(expected_quotes_by_person_id[person.id])
+        assert len(random_quotes) == num_quotes
+
+
 @pytest.mark.parametrize("num_quotes", [0, 1, 5])
 def test_get_all_quotes_from_person(num_quotes, client, session):
     person = mixer.blend(Person, slack_user_id=mixer.RANDOM)